@@ -94,6 +94,31 @@ try {
         $command .= ' --keywords ' . escapeshellarg($data['keywords']);
     }
 
+    // Fetch job detail pages if requested
+    if (!empty($data['enrich'])) {
+        $command .= ' --enrich';
+    }
+
+    // Serve from the job store kept warm by crawl_scheduler.py when it is fresh enough
+    $maxAge = isset($data['maxAge']) ? (int)$data['maxAge'] : 3600;
+    if ($maxAge > 0) {
+        $command .= ' --max-age ' . $maxAge;
+    }
+
+    // Compare against the previous run of this query
+    $deltaOnly = !empty($data['deltaOnly']);
+    if ($deltaOnly) {
+        $command .= ' --delta-only';
+    } elseif (!empty($data['delta'])) {
+        $command .= ' --delta';
+    }
+
+    // Clients that page results from the results API in app.py only need a summary
+    $paginate = !$deltaOnly && !empty($data['paginate']);
+    if ($paginate) {
+        $command .= ' --summary';
+    }
+
     error_log("Executing command: " . $command);
 
     // Execute the Python script with full environment
@@ -137,12 +162,51 @@ try {
         throw new Exception("Failed to execute Python script");
     }
 
-    // Read the JSON output from the Python script
+    // In delta-only mode the script prints the delta and writes no full dump
+    if ($deltaOnly) {
+        $delta = json_decode($output, true);
+        if (json_last_error() !== JSON_ERROR_NONE) {
+            throw new Exception("Invalid delta JSON from Python script: " . json_last_error_msg());
+        }
+
+        echo json_encode([
+            'success' => true,
+            'message' => 'Scraping completed successfully',
+            'data' => [
+                'total_jobs' => $delta['total_jobs'],
+                'delta_file' => 'results/' . "jobs_{$timestamp}_delta.json",
+                'delta' => $delta
+            ]
+        ]);
+        exit;
+    }
+
+    // Check the JSON output file was written
     $jsonPath = $resultsDir . '/' . $jsonFile;
     if (!file_exists($jsonPath)) {
         throw new Exception("JSON file not found: " . $jsonPath . "\nCommand output: " . $output . "\nErrors: " . $errors);
     }
 
+    if ($paginate) {
+        // The script prints a summary; the jobs are paged from the results API instead of sent here
+        $summary = json_decode($output, true);
+        if (json_last_error() !== JSON_ERROR_NONE) {
+            throw new Exception("Invalid summary JSON from Python script: " . json_last_error_msg());
+        }
+
+        echo json_encode([
+            'success' => true,
+            'message' => 'Scraping completed successfully',
+            'data' => [
+                'total_jobs' => $summary['total_jobs'],
+                'csv_file' => 'results/' . $csvFile,
+                'json_file' => 'results/' . $jsonFile,
+                'result' => $jsonFile
+            ]
+        ]);
+        exit;
+    }
+
     $jsonContent = file_get_contents($jsonPath);
     if ($jsonContent === false) {
         throw new Exception("Failed to read JSON file: " . $jsonPath);
@@ -161,6 +225,7 @@ try {
             'total_jobs' => count($jobs),
             'csv_file' => 'results/' . $csvFile,
             'json_file' => 'results/' . $jsonFile,
+            'result' => $jsonFile,
             'jobs' => $jobs
         ]
     ]);
@@ -1,7 +1,33 @@
-from flask import Flask, render_template, request, jsonify, make_response
+from flask import Flask, Response, render_template, request, jsonify, make_response
+import hashlib
 import os
 import logging
 import json
+import time
+
+from config import (
+    JOB_STORE_DIR,
+    RESULTS_API_URL,
+    RESULTS_DEFAULT_LIMIT,
+    RESULTS_DIR,
+    RESULTS_MAX_LIMIT,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+)
+from job_index import JobIndex
+from results_api import (
+    CursorError,
+    decode_cursor,
+    encode_cursor,
+    encode_stream,
+    read_results,
+    result_count,
+    page_json,
+    project,
+    result_path,
+    result_version,
+    supported_encodings,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +44,14 @@ app = Flask(__name__,
            template_folder=TEMPLATE_DIR,
            static_folder=os.path.abspath(os.path.join(os.path.dirname(__file__), 'static')))
 
+RESULTS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), RESULTS_DIR))
+
+# Search index over the job store and the latest saved results, kept in sync with the files on each search
+job_index = JobIndex(
+    store_dir=os.path.abspath(os.path.join(os.path.dirname(__file__), JOB_STORE_DIR)),
+    results_dir=RESULTS_PATH
+)
+
 def json_response(data, status=200):
     response = make_response(jsonify(data), status)
     response.headers['Content-Type'] = 'application/json'
@@ -27,7 +61,7 @@ def json_response(data, status=200):
 def index():
     logging.info("Accessing root route")
     try:
-        return render_template('index.html')
+        return render_template('index.html', results_api_url=RESULTS_API_URL or request.script_root)
     except Exception as e:
         logging.error(f"Error rendering template: {str(e)}")
         return str(e), 500
@@ -58,6 +92,97 @@ def scrape():
         logging.error(f"Error in scrape route: {str(e)}")
         return json_response({"error": str(e)}, 500)
 
+@app.route('/search')
+def search():
+    logging.info("Accessing search route")
+    try:
+        started = time.perf_counter()
+        query = request.args.get('q', '')
+        skills = request.args.getlist('skill')
+        job_board = request.args.get('board')
+        try:
+            limit = min(max(int(request.args.get('limit', SEARCH_DEFAULT_LIMIT)), 1), SEARCH_MAX_LIMIT)
+            offset = max(int(request.args.get('offset', 0)), 0)
+        except ValueError:
+            return json_response({"error": "limit and offset must be integers"}, 400)
+
+        job_index.sync_store()
+        result = job_index.search(query, skills=skills, job_board=job_board, limit=limit, offset=offset)
+
+        return json_response({
+            "success": True,
+            "query": query,
+            "skills": skills,
+            "board": job_board,
+            "limit": limit,
+            "offset": offset,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            **result
+        })
+
+    except Exception as e:
+        logging.error(f"Error in search route: {str(e)}")
+        return json_response({"error": str(e)}, 500)
+
+@app.route('/results/<name>')
+def results(name):
+    logging.info(f"Accessing results route for {name}")
+    try:
+        path = result_path(RESULTS_PATH, name)
+        if not path:
+            return json_response({"error": f"Result set not found: {name}"}, 404)
+
+        try:
+            limit = min(max(int(request.args.get('limit', RESULTS_DEFAULT_LIMIT)), 1), RESULTS_MAX_LIMIT)
+        except ValueError:
+            return json_response({"error": "limit must be an integer"}, 400)
+        fields = [field for field in request.args.get('fields', '').split(',') if field] or None
+
+        version = result_version(path)
+        cursor = request.args.get('cursor')
+        try:
+            offset = decode_cursor(cursor, version) if cursor else 0
+        except CursorError as e:
+            return json_response({"error": str(e)}, 400)
+
+        # Pick the response encoding; without an Accept-Encoding header send plain JSON
+        encoding = 'identity'
+        if request.headers.get('Accept-Encoding'):
+            encoding = request.accept_encodings.best_match(supported_encodings(), default='identity')
+
+        # The page is fully determined by the file version and the request parameters
+        page_key = json.dumps([offset, limit, fields])
+        etag = f"{version}-{hashlib.sha1(page_key.encode('utf-8')).hexdigest()[:8]}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            try:
+                total = result_count(path)
+            except ValueError as e:
+                return json_response({"error": str(e)}, 400)
+            page = read_results(path, offset, offset + limit)
+            header = {
+                "success": True,
+                "result": name,
+                "total": total,
+                "offset": offset,
+                "count": len(page),
+                "next_cursor": encode_cursor(offset + limit, version) if offset + limit < total else None
+            }
+            body = page_json(header, (project(job, fields) for job in page))
+            response = Response(encode_stream(body, encoding), mimetype='application/json')
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag, weak=True)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    except Exception as e:
+        logging.error(f"Error in results route: {str(e)}")
+        return json_response({"error": str(e)}, 500)
+
 if __name__ == '__main__':
     logging.info("Starting Flask application")
     print(f"Template directory: {TEMPLATE_DIR}")
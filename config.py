@@ -35,4 +35,102 @@ JOB_FIELDS = [
     'job_type',
     'experience_level',
     'closing_date'
-] 
\ No newline at end of file
+] 
+
+# Detail page enrichment settings
+ENRICH_MAX_WORKERS = 16  # total concurrent detail page fetches
+ENRICH_PER_HOST_LIMIT = 4  # concurrent fetches allowed against a single host
+ENRICH_HOST_DELAY = 0.5  # seconds between requests to the same host
+ENRICH_CACHE_DIR = 'cache/details'
+ENRICH_CACHE_TTL = 24 * 60 * 60  # seconds before a cached detail page is refetched
+
+# Fetch strategy settings
+FETCH_STATE_PATH = 'cache/fetch_modes.json'  # remembered HTTP/browser choice per job board
+FETCH_RECHECK_INTERVAL = 6 * 60 * 60  # seconds before a browser-only board is retried over HTTP
+
+# Crawl scheduler settings
+JOB_STORE_DIR = 'results/store'  # per-query snapshots kept warm by the scheduler, apart from --delta baselines
+SCHEDULER_STATE_PATH = 'cache/scheduler_state.json'
+STANDING_QUERIES = [
+    {'job_board': 'indeed', 'location': 'Johannesburg', 'keywords': 'developer'},
+    {'job_board': 'indeed', 'location': 'Cape Town', 'keywords': 'developer'},
+    {'job_board': 'careers24', 'location': 'Johannesburg', 'keywords': 'developer'},
+    {'job_board': 'careers24', 'location': 'Cape Town', 'keywords': 'developer'},
+    {'job_board': 'pnet', 'location': 'Johannesburg', 'keywords': 'developer'},
+    {'job_board': 'pnet', 'location': 'Cape Town', 'keywords': 'developer'},
+]
+SCHEDULER_MAX_PAGES = 2
+SCHEDULER_DEFAULT_INTERVAL = 3 * 60 * 60  # seconds between crawls before any churn is observed
+SCHEDULER_MIN_INTERVAL = 30 * 60
+SCHEDULER_MAX_INTERVAL = 24 * 60 * 60
+SCHEDULER_TARGET_NEW_JOBS = 5  # recrawl once about this many new jobs are expected
+SCHEDULER_BOARD_SPACING = {  # minimum seconds between crawls of the same board
+    'indeed': 120,
+    'careers24': 60,
+    'pnet': 60,
+}
+
+# Search settings
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+SEARCH_TITLE_WEIGHT = 3  # title terms count this many times towards a job's term frequency
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_FACET_LIMIT = 25
+
+# Skills dictionary used for search facets: canonical name -> aliases
+SKILLS = {
+    'Python': ['python'],
+    'Java': ['java'],
+    'JavaScript': ['javascript'],
+    'TypeScript': ['typescript'],
+    'C#': ['c#', 'c sharp'],
+    'C++': ['c++'],
+    'PHP': ['php'],
+    'Ruby': ['ruby'],
+    'Go': ['golang'],
+    'Kotlin': ['kotlin'],
+    'Swift': ['swift'],
+    'SQL': ['sql', 't-sql', 'pl/sql'],
+    'MySQL': ['mysql'],
+    'PostgreSQL': ['postgresql', 'postgres'],
+    'SQL Server': ['sql server', 'mssql'],
+    'Oracle': ['oracle'],
+    'MongoDB': ['mongodb', 'mongo'],
+    '.NET': ['.net', 'dotnet', 'asp.net'],
+    'Django': ['django'],
+    'Flask': ['flask'],
+    'Laravel': ['laravel'],
+    'React': ['react', 'react.js', 'reactjs'],
+    'Angular': ['angular', 'angularjs'],
+    'Vue.js': ['vue', 'vue.js', 'vuejs'],
+    'Node.js': ['node.js', 'nodejs', 'node'],
+    'HTML': ['html', 'html5'],
+    'CSS': ['css', 'css3'],
+    'AWS': ['aws', 'amazon web services'],
+    'Azure': ['azure'],
+    'GCP': ['gcp', 'google cloud'],
+    'Docker': ['docker'],
+    'Kubernetes': ['kubernetes', 'k8s'],
+    'Git': ['git'],
+    'Linux': ['linux'],
+    'Excel': ['excel', 'ms excel'],
+    'Power BI': ['power bi', 'powerbi'],
+    'SAP': ['sap'],
+    'Pastel': ['pastel', 'sage pastel'],
+    'Salesforce': ['salesforce'],
+    'Project Management': ['project management', 'pmp', 'prince2'],
+    'Agile': ['agile', 'scrum'],
+    'Machine Learning': ['machine learning', 'ml'],
+    'Data Analysis': ['data analysis', 'data analytics'],
+    'Accounting': ['accounting', 'bookkeeping'],
+    "Driver's Licence": ["driver's licence", "drivers licence", "driver's license", 'code 8', 'code 10'],
+}
+
+# Results API settings
+RESULTS_DIR = 'results'
+RESULTS_DEFAULT_LIMIT = 50
+RESULTS_MAX_LIMIT = 500
+RESULTS_CACHE_SIZE = 32  # result file offset indexes kept in memory
+RESULTS_CHUNK_SIZE = 16 * 1024  # bytes of JSON handed to the compressor at a time
+RESULTS_API_URL = ''  # base URL of app.py as the browser reaches it, on the page's origin; empty uses the app's own root
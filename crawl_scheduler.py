@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from config import (
+    JOB_STORE_DIR,
+    REQUEST_DELAY,
+    SCHEDULER_BOARD_SPACING,
+    SCHEDULER_DEFAULT_INTERVAL,
+    SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_MAX_PAGES,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_STATE_PATH,
+    SCHEDULER_TARGET_NEW_JOBS,
+    STANDING_QUERIES,
+)
+from job_delta import build_snapshot, compute_delta, load_snapshot, save_snapshot, scrape_failed, snapshot_path
+from job_enricher import JobEnricher
+from scrape_jobs import JobScraper
+
+logger = logging.getLogger(__name__)
+
+STORE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), JOB_STORE_DIR))
+
+# Weight of the latest crawl when updating a query's new-jobs rate
+RATE_SMOOTHING = 0.3
+
+
+def query_key(query: Dict) -> str:
+    return '|'.join([query['job_board'].lower(), query['location'], query.get('keywords') or ''])
+
+
+class CrawlScheduler:
+    """Recrawl standing queries at intervals learned from how often new jobs appear.
+
+    Each query tracks a smoothed rate of new jobs per hour. Its next crawl is
+    scheduled for when about SCHEDULER_TARGET_NEW_JOBS new jobs are expected,
+    within the configured interval bounds. Among due queries the one with the
+    most expected new jobs runs first, and crawls of the same board are kept
+    at least SCHEDULER_BOARD_SPACING seconds apart. Results are written to
+    the per-query snapshots in JOB_STORE_DIR. A crawl with failed pages, or
+    one that returns nothing for a query that had jobs, counts as a failure:
+    the stored snapshot is kept and the learned rate is left alone.
+    """
+
+    def __init__(self, queries: List[Dict] = STANDING_QUERIES, store_dir: str = STORE_PATH,
+                 state_path: Optional[str] = SCHEDULER_STATE_PATH, max_pages: int = SCHEDULER_MAX_PAGES,
+                 enrich: bool = False):
+        self.queries = {query_key(query): query for query in queries}
+        self.store_dir = store_dir
+        self.state_path = state_path
+        self.max_pages = max_pages
+        self.enrich = enrich
+        self.state = self._load_state()
+        self.board_next_allowed = {}
+
+    def expected_new_jobs(self, key: str, now: float) -> float:
+        """New jobs expected since the query was last crawled"""
+        entry = self.state.get(key)
+        if not entry or entry['last_crawl'] is None:
+            return float('inf')
+        return entry['rate'] * (now - entry['last_crawl']) / 3600
+
+    def due_queries(self, now: float) -> List[str]:
+        """Due query keys, highest expected churn first"""
+        due = [key for key in self.queries if self.state.get(key, {}).get('next_due', 0) <= now]
+        return sorted(due, key=lambda key: self.expected_new_jobs(key, now), reverse=True)
+
+    def next_query(self, now: float) -> Optional[str]:
+        """Most urgent due query whose board is not rate limited"""
+        for key in self.due_queries(now):
+            board = self.queries[key]['job_board'].lower()
+            if self.board_next_allowed.get(board, 0) <= now:
+                return key
+        return None
+
+    def seconds_until_next(self, now: float) -> float:
+        """How long to sleep before another query can run"""
+        waits = []
+        for key, query in self.queries.items():
+            board = query['job_board'].lower()
+            ready = max(self.state.get(key, {}).get('next_due', 0), self.board_next_allowed.get(board, 0))
+            waits.append(ready - now)
+        return max(min(waits, default=SCHEDULER_DEFAULT_INTERVAL), REQUEST_DELAY)
+
+    def crawl(self, key: str) -> Optional[Dict]:
+        """Scrape a query, update its snapshot and return the delta, or None if the scrape failed"""
+        query = self.queries[key]
+        logger.info(f"Crawling {query['job_board']} in {query['location']} for '{query.get('keywords') or ''}'")
+
+        scraper = JobScraper(job_board=query['job_board'], location=query['location'], keywords=query.get('keywords'))
+        jobs = scraper.scrape(max_pages=self.max_pages)
+        if self.enrich:
+            JobEnricher(headers=dict(scraper.session.headers)).enrich(jobs)
+
+        path = snapshot_path(self.store_dir, query['job_board'], query['location'], query.get('keywords'))
+        previous = load_snapshot(path, query)
+        if scrape_failed(jobs, scraper.failed_pages, previous):
+            logger.warning(f"Crawl of {key} was incomplete (failed pages: {scraper.failed_pages}, "
+                           f"{len(jobs)} jobs), keeping the stored snapshot")
+            self.record_failure(key)
+            return None
+
+        snapshot = build_snapshot(jobs, query=dict(query, enriched=self.enrich, max_pages=self.max_pages))
+        delta = compute_delta(previous, snapshot)
+        save_snapshot(snapshot, path)
+
+        self.record_crawl(key, len(delta['added']) if previous else None)
+        logger.info(f"{len(jobs)} jobs, {len(delta['added'])} new, {len(delta['updated'])} updated, "
+                    f"{len(delta['removed'])} removed; next crawl in {self.state[key]['interval'] / 60:.0f} minutes")
+        return delta
+
+    def record_crawl(self, key: str, new_jobs: Optional[int], now: Optional[float] = None) -> None:
+        """Update a query's churn rate and schedule its next crawl.
+
+        new_jobs is None for the first crawl of a query, when every job is new
+        and says nothing about churn.
+        """
+        now = now or time.time()
+        entry = self.state.get(key)
+
+        if entry is None or entry['last_crawl'] is None or new_jobs is None:
+            rate = entry['rate'] if entry else 0.0
+            interval = entry['interval'] if entry else SCHEDULER_DEFAULT_INTERVAL
+        else:
+            elapsed_hours = max(now - entry['last_crawl'], 1) / 3600
+            rate = RATE_SMOOTHING * (new_jobs / elapsed_hours) + (1 - RATE_SMOOTHING) * entry['rate']
+            if rate > 0:
+                interval = SCHEDULER_TARGET_NEW_JOBS / rate * 3600
+            else:
+                # Nothing new for a while, back off
+                interval = entry['interval'] * 2
+        interval = min(max(interval, SCHEDULER_MIN_INTERVAL), SCHEDULER_MAX_INTERVAL)
+
+        self.state[key] = {
+            'last_crawl': now,
+            'rate': rate,
+            'interval': interval,
+            'next_due': now + interval,
+        }
+        self._space_board(key, now)
+        self._save_state()
+
+    def record_failure(self, key: str, now: Optional[float] = None) -> None:
+        """Retry a failed crawl after the query's interval.
+
+        The last successful crawl time and the learned rate are kept, so the
+        next good crawl measures churn over the whole gap.
+        """
+        now = now or time.time()
+        entry = self.state.get(key) or {'last_crawl': None, 'rate': 0.0, 'interval': SCHEDULER_DEFAULT_INTERVAL}
+        self.state[key] = dict(entry, next_due=now + entry['interval'])
+        self._space_board(key, now)
+        self._save_state()
+
+    def _space_board(self, key: str, now: float) -> None:
+        board = self.queries[key]['job_board'].lower()
+        self.board_next_allowed[board] = now + SCHEDULER_BOARD_SPACING.get(board, REQUEST_DELAY)
+
+    def run_pending(self) -> int:
+        """Crawl every query that is due, respecting board spacing; returns the number crawled"""
+        crawled = 0
+        while True:
+            now = time.time()
+            if not self.due_queries(now):
+                return crawled
+
+            key = self.next_query(now)
+            if key is None:
+                time.sleep(self.seconds_until_next(now))
+                continue
+
+            try:
+                self.crawl(key)
+            except Exception as e:
+                logger.error(f"Error crawling {key}: {e}")
+                # Try again later rather than hammering a failing board
+                self.record_failure(key)
+            crawled += 1
+
+    def run_forever(self) -> None:
+        logger.info(f"Scheduling {len(self.queries)} standing queries")
+        while True:
+            self.run_pending()
+            time.sleep(self.seconds_until_next(time.time()))
+
+    def _load_state(self) -> Dict:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read scheduler state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            tmp_path = self.state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save scheduler state {self.state_path}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recurring crawl scheduler for standing job queries')
+    parser.add_argument('--once', action='store_true', help='Crawl the queries that are due and exit (for cron)')
+    parser.add_argument('--max-pages', type=int, default=SCHEDULER_MAX_PAGES, help='Maximum number of pages to scrape per query')
+    parser.add_argument('--enrich', action='store_true', help='Fetch job detail pages for every crawl')
+
+    args = parser.parse_args()
+
+    scheduler = CrawlScheduler(max_pages=args.max_pages, enrich=args.enrich)
+    if args.once:
+        crawled = scheduler.run_pending()
+        logger.info(f"Crawled {crawled} queries")
+    else:
+        scheduler.run_forever()
+
+if __name__ == '__main__':
+    main()
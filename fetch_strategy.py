@@ -0,0 +1,177 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from config import FETCH_RECHECK_INTERVAL, FETCH_STATE_PATH, TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+HTTP = 'http'
+BROWSER = 'browser'
+
+NO_JOB_CARDS = 'no job cards'
+
+# Markers of pages that only show their content once JavaScript has run
+JS_SHELL_SIGNATURES = [
+    re.compile(r'(please\s+)?enable\s+javascript', re.IGNORECASE),
+    re.compile(r'javascript\s+is\s+(required|disabled)', re.IGNORECASE),
+    re.compile(r'<div\s+id="(root|app|__next)"\s*>\s*</div>', re.IGNORECASE),
+    re.compile(r'cf-browser-verification|challenge-platform', re.IGNORECASE),
+]
+
+# Markers of valid listing pages that simply have no jobs on them
+NO_RESULTS_SIGNATURES = [
+    re.compile(r'no\s+(jobs|results|vacancies|matches)\s+(were\s+)?found', re.IGNORECASE),
+    re.compile(r'(did\s+not|didn\'t)\s+match\s+any\s+jobs', re.IGNORECASE),
+    re.compile(r'no\s+jobs\s+match', re.IGNORECASE),
+]
+
+# Status codes bot challenges are served with
+CHALLENGE_STATUSES = (403, 503)
+
+
+class FetchStrategy:
+    """Fetch listing pages over plain HTTP, using a headless browser only when needed.
+
+    A page is sent to the browser when the HTTP response looks like a
+    JavaScript shell page or bot challenge (including 403/503 challenge
+    responses), or when it has none of the expected job cards, no "no
+    results" marker, and the board has not recently been confirmed to work
+    over HTTP. Boards that needed the browser are remembered, so later pages
+    skip the wasted HTTP attempt, and are retried over HTTP once the recheck
+    interval has passed. A browser render that finds no job cards either is
+    remembered as an HTTP verdict, so empty pages do not keep starting Chrome.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None, state_path: Optional[str] = FETCH_STATE_PATH,
+                 recheck_interval: int = FETCH_RECHECK_INTERVAL):
+        self.session = session or requests.Session()
+        self.state_path = state_path
+        self.recheck_interval = recheck_interval
+        self.renderer = None
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+    def fetch(self, job_board: str, url: str, card_tag: str, card_class: str) -> BeautifulSoup:
+        """Return the parsed listing page, rendered in the browser if HTTP was not enough"""
+        soup = None
+        challenge = None
+        if self.mode_for(job_board) == HTTP:
+            response = self.session.get(url, timeout=TIMEOUT)
+            if response.status_code in CHALLENGE_STATUSES and self._is_shell(response.text):
+                challenge = requests.HTTPError(f"{response.status_code} browser challenge for url: {url}", response=response)
+                reason = f"a browser challenge (HTTP {response.status_code})"
+            else:
+                response.raise_for_status()
+                reason = None
+            soup = BeautifulSoup(response.text, 'html.parser')
+
+            if not reason:
+                reason = self.needs_browser(response.text, soup, card_tag, card_class)
+                if reason == NO_JOB_CARDS and self.http_confirmed(job_board):
+                    # The board works over HTTP, so this is an empty page rather than a shell
+                    return soup
+            if not reason:
+                self.remember(job_board, HTTP)
+                return soup
+            logger.info(f"{job_board} page has {reason}, falling back to browser: {url}")
+
+        try:
+            rendered = BeautifulSoup(self._render(url, card_class), 'html.parser')
+        except Exception as e:
+            logger.error(f"Error rendering {url} in browser: {e}")
+            if challenge:
+                raise challenge
+            if soup is None:
+                raise
+            return soup
+
+        if soup is not None:
+            if rendered.find(card_tag, class_=card_class):
+                # Only commit to the browser after HTTP was tried and the browser produced job cards
+                self.remember(job_board, BROWSER)
+            elif not challenge:
+                # The browser found nothing either, so HTTP is good enough for this board
+                self.remember(job_board, HTTP)
+        return rendered
+
+    def needs_browser(self, html: str, soup: BeautifulSoup, card_tag: str, card_class: str) -> Optional[str]:
+        """Reason an HTTP response lacks the content a browser would render, or None"""
+        if soup.find(card_tag, class_=card_class):
+            return None
+        if self._is_shell(html):
+            return 'a JavaScript shell signature'
+        if any(signature.search(html) for signature in NO_RESULTS_SIGNATURES):
+            return None
+        return NO_JOB_CARDS
+
+    def http_confirmed(self, job_board: str) -> bool:
+        """Whether the board was recently seen to work over HTTP"""
+        entry = self.state.get(job_board)
+        return bool(entry and entry['mode'] == HTTP and time.time() - entry['checked_at'] <= self.recheck_interval)
+
+    def _is_shell(self, html: str) -> bool:
+        return any(signature.search(html) for signature in JS_SHELL_SIGNATURES)
+
+    def mode_for(self, job_board: str) -> str:
+        """Fetch mode to try first for a board"""
+        entry = self.state.get(job_board)
+        if not entry or entry['mode'] == HTTP:
+            return HTTP
+        if time.time() - entry['checked_at'] > self.recheck_interval:
+            logger.info(f"Rechecking whether {job_board} can be fetched over HTTP")
+            return HTTP
+        return BROWSER
+
+    def remember(self, job_board: str, mode: str) -> None:
+        with self._lock:
+            entry = self.state.get(job_board)
+            # Refresh an unchanged HTTP verdict at most once per recheck interval
+            if mode == HTTP and self.http_confirmed(job_board):
+                return
+            if not entry or entry['mode'] != mode:
+                logger.info(f"Fetching {job_board} via {mode} from now on")
+            self.state[job_board] = {'mode': mode, 'checked_at': time.time()}
+            self._save_state()
+
+    def close(self) -> None:
+        """Shut down the browser if one was started"""
+        if self.renderer:
+            self.renderer.close()
+            self.renderer = None
+
+    def _render(self, url: str, wait_class: str) -> str:
+        if self.renderer is None:
+            # Selenium is only loaded once a board actually needs it
+            from scrapers.page_renderer import PageRenderer
+            self.renderer = PageRenderer()
+        return self.renderer.render(url, wait_class=wait_class)
+
+    def _load_state(self) -> Dict:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read fetch state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            tmp_path = self.state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save fetch state {self.state_path}: {e}")
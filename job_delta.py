@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Fields that describe the query rather than the job, so they never count as a change
+HASH_EXCLUDED_FIELDS = ['keywords']
+
+# Fields JobEnricher fills in from detail pages; only compared when both runs used enrichment or neither did
+DETAIL_FIELDS = ['requirements', 'description', 'posted_date', 'job_type']
+
+
+def job_key(job: Dict) -> str:
+    """Stable identity for a job across runs"""
+    url = job.get('url')
+    if url and url != 'N/A':
+        return url
+    identity = '|'.join(str(job.get(field, '')) for field in ('job_board', 'title', 'company', 'location'))
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+
+def job_hash(job: Dict) -> str:
+    """Content hash of a job, used to detect changes between runs"""
+    content = {k: v for k, v in job.items() if k not in HASH_EXCLUDED_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def _slug(value: Optional[str]) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', (value or '').lower()).strip('-') or 'any'
+
+
+def _query_fields(job_board: str, location: str, keywords: Optional[str]) -> List[str]:
+    return [(job_board or '').lower(), location or '', keywords or '']
+
+
+def snapshot_path(snapshot_dir: str, job_board: str, location: str, keywords: Optional[str] = None) -> str:
+    """Path of the snapshot file for a board/location/keywords query.
+
+    The slugs keep the name readable; the hash of the raw values keeps queries
+    such as "C#" and "C++" that slug to the same name in separate files.
+    """
+    digest = hashlib.sha1('|'.join(_query_fields(job_board, location, keywords)).encode('utf-8')).hexdigest()[:8]
+    filename = f"{_slug(job_board)}__{_slug(location)}__{_slug(keywords)}__{digest}.json"
+    return os.path.join(snapshot_dir, filename)
+
+
+def snapshot_matches(snapshot: Dict, job_board: str, location: str, keywords: Optional[str] = None) -> bool:
+    """Whether a snapshot was taken for this board/location/keywords query"""
+    query = snapshot.get('query', {})
+    return _query_fields(query.get('job_board'), query.get('location'), query.get('keywords')) == \
+        _query_fields(job_board, location, keywords)
+
+
+def build_snapshot(jobs: List[Dict], query: Optional[Dict] = None) -> Dict:
+    """Index jobs by key together with their content hash"""
+    return {
+        'query': query or {},
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+        'jobs': {job_key(job): {'hash': job_hash(job), 'job': job} for job in jobs},
+    }
+
+
+def load_snapshot(path: str, query: Optional[Dict] = None) -> Optional[Dict]:
+    """Load a previous snapshot, or None if this query has not been run before.
+
+    When query is given, a snapshot taken for a different query is ignored.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    if query is not None and not snapshot_matches(snapshot, query.get('job_board'), query.get('location'),
+                                                  query.get('keywords')):
+        return None
+    return snapshot
+
+
+def save_snapshot(snapshot: Dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def scrape_failed(jobs: List[Dict], failed_pages: List[int], previous: Optional[Dict]) -> bool:
+    """Whether a scrape is too incomplete to replace the previous snapshot.
+
+    That is the case when any listing page errored, or when nothing came back
+    for a query that had jobs last time, which is far more likely an outage or
+    a block than every job disappearing at once.
+    """
+    if failed_pages:
+        return True
+    return not jobs and bool(previous and previous.get('jobs'))
+
+
+def incomplete_delta(query: Dict, previous: Optional[Dict], failed_pages: List[int]) -> Dict:
+    """Empty delta for a failed scrape, so consumers know to keep what they have"""
+    return {
+        'query': query,
+        'complete': False,
+        'failed_pages': failed_pages,
+        'previous_run': previous.get('updated_at') if previous else None,
+        'current_run': datetime.now().isoformat(timespec='seconds'),
+        'total_jobs': len(previous['jobs']) if previous else 0,
+        'unchanged': 0,
+        'added': [],
+        'updated': [],
+        'removed': [],
+    }
+
+
+def compute_delta(previous: Optional[Dict], current: Dict) -> Dict:
+    """Compare two snapshots and return added, updated and removed jobs.
+
+    Updated jobs carry only the fields that changed, with their old and new
+    values. Removed jobs are reported by key, title and url. Detail page
+    fields are ignored when only one of the runs was enriched.
+    """
+    previous_jobs = previous['jobs'] if previous else {}
+    current_jobs = current['jobs']
+
+    ignored = set(HASH_EXCLUDED_FIELDS)
+    if previous and previous.get('query', {}).get('enriched', False) != current.get('query', {}).get('enriched', False):
+        ignored.update(DETAIL_FIELDS)
+
+    added = []
+    updated = []
+    unchanged = 0
+    for key, entry in current_jobs.items():
+        old_entry = previous_jobs.get(key)
+        if old_entry is None:
+            added.append(entry['job'])
+            continue
+
+        changed_fields = {}
+        if old_entry['hash'] != entry['hash']:
+            old_job, new_job = old_entry['job'], entry['job']
+            changed_fields = {
+                field: {'old': old_job.get(field), 'new': new_job.get(field)}
+                for field in sorted(set(old_job) | set(new_job))
+                if field not in ignored and old_job.get(field) != new_job.get(field)
+            }
+        if changed_fields:
+            updated.append({'key': key, 'url': entry['job'].get('url'), 'changed_fields': changed_fields})
+        else:
+            unchanged += 1
+
+    removed = [
+        {'key': key, 'title': entry['job'].get('title'), 'url': entry['job'].get('url')}
+        for key, entry in previous_jobs.items()
+        if key not in current_jobs
+    ]
+
+    return {
+        'query': current.get('query', {}),
+        'complete': True,
+        'previous_run': previous.get('updated_at') if previous else None,
+        'current_run': current.get('updated_at'),
+        'total_jobs': len(current_jobs),
+        'unchanged': unchanged,
+        'added': added,
+        'updated': updated,
+        'removed': removed,
+    }
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from config import (
+    ENRICH_CACHE_DIR,
+    ENRICH_CACHE_TTL,
+    ENRICH_HOST_DELAY,
+    ENRICH_MAX_WORKERS,
+    ENRICH_PER_HOST_LIMIT,
+    MAX_RETRIES,
+    TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields filled in from the job detail page
+ENRICHED_FIELDS = ['requirements', 'description', 'posted_date', 'job_type']
+
+# Fallback selectors per job board, used when the page has no JobPosting JSON-LD
+DETAIL_SELECTORS = {
+    'indeed': {
+        'description': [('div', {'id': 'jobDescriptionText'})],
+        'requirements': [('div', {'id': 'qualificationsSection'})],
+        'posted_date': [('span', {'class': 'date'})],
+        'job_type': [('div', {'id': 'salaryInfoAndJobType'})],
+    },
+    'careers24': {
+        'description': [('div', {'class': 'job-description'})],
+        'requirements': [('div', {'class': 'qualifications'}), ('div', {'class': 'requirements'})],
+        'posted_date': [('div', {'class': 'date-posted'}), ('span', {'class': 'posted-date'})],
+        'job_type': [('div', {'class': 'job-type'}), ('li', {'class': 'job-type'})],
+    },
+    'pnet': {
+        'description': [('div', {'class': 'job-description'})],
+        'requirements': [('div', {'class': 'requirements'}), ('div', {'class': 'qualifications'})],
+        'posted_date': [('div', {'class': 'date-posted'}), ('span', {'class': 'posted-date'})],
+        'job_type': [('div', {'class': 'job-type'}), ('li', {'class': 'job-type'})],
+    },
+}
+
+
+def _json_ld_text(value) -> str:
+    """Text of a JSON-LD property that may be a string, an object or a list of either"""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return _json_ld_text(value.get('name') or value.get('description'))
+    if isinstance(value, list):
+        return ', '.join(text for text in (_json_ld_text(item) for item in value) if text)
+    return ''
+
+
+class JobEnricher:
+    """Fill in detail page fields for jobs collected from listing pages.
+
+    Detail pages are fetched concurrently with a cap on in-flight requests
+    per host, and parsed results are cached on disk so repeated runs only
+    fetch jobs that are new or whose cache entry has expired.
+    """
+
+    def __init__(self, headers: Optional[Dict] = None, max_workers: int = ENRICH_MAX_WORKERS,
+                 per_host_limit: int = ENRICH_PER_HOST_LIMIT, host_delay: float = ENRICH_HOST_DELAY,
+                 cache_dir: Optional[str] = ENRICH_CACHE_DIR, cache_ttl: int = ENRICH_CACHE_TTL):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.host_delay = host_delay
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers,
+                              max_retries=MAX_RETRIES)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._host_last_request = {}
+        self._memory_cache = {}
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def enrich(self, jobs: List[Dict]) -> List[Dict]:
+        """Enrich jobs in place and return them"""
+        urls = []
+        for job in jobs:
+            url = job.get('url')
+            if url and url != 'N/A' and url not in urls:
+                urls.append(url)
+
+        if not urls:
+            return jobs
+
+        logger.info(f"Enriching {len(jobs)} jobs from {len(urls)} detail pages")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            details = dict(zip(urls, executor.map(self.get_details, urls)))
+
+        enriched = 0
+        for job in jobs:
+            detail = details.get(job.get('url'))
+            if detail:
+                self.merge_details(job, detail)
+                enriched += 1
+            else:
+                job.setdefault('job_type', 'N/A')
+
+        logger.info(f"Enriched {enriched} of {len(jobs)} jobs")
+        return jobs
+
+    def merge_details(self, job: Dict, detail: Dict) -> None:
+        """Copy detail page fields onto a job, keeping listing values the page lacks"""
+        for field in ENRICHED_FIELDS:
+            value = detail.get(field)
+            if not value:
+                job.setdefault(field, 'N/A')
+                continue
+            # The listing only carries a snippet, so prefer the longer detail text
+            if field == 'description' and len(value) < len(job.get(field) or ''):
+                continue
+            job[field] = value
+
+    def get_details(self, url: str) -> Optional[Dict]:
+        """Return parsed detail fields for a URL, from cache when fresh"""
+        cached = self._read_cache(url)
+        if cached is not None:
+            return cached
+
+        try:
+            html = self._fetch(url)
+        except Exception as e:
+            logger.error(f"Error fetching job detail page {url}: {e}")
+            return None
+
+        try:
+            detail = self.parse_detail_page(html, self._board_for_url(url))
+        except Exception as e:
+            logger.error(f"Error parsing job detail page {url}: {e}")
+            return None
+
+        # An empty parse is usually a consent or bot-check page, so leave it to be refetched
+        if detail:
+            self._write_cache(url, detail)
+        return detail
+
+    def parse_detail_page(self, html: str, job_board: Optional[str] = None) -> Dict:
+        """Extract enriched fields from a detail page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        detail = self._parse_json_ld(soup)
+
+        for field, selectors in DETAIL_SELECTORS.get(job_board, {}).items():
+            if detail.get(field):
+                continue
+            for tag, attrs in selectors:
+                elem = soup.find(tag, attrs=attrs)
+                if elem:
+                    detail[field] = elem.get_text(' ', strip=True)
+                    break
+
+        return detail
+
+    def _parse_json_ld(self, soup: BeautifulSoup) -> Dict:
+        """Read fields from a schema.org JobPosting block, which most boards embed"""
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                data = json.loads(script.string or '')
+            except ValueError:
+                continue
+
+            if isinstance(data, list):
+                candidates = data
+            elif isinstance(data, dict):
+                candidates = data.get('@graph', [data])
+                if not isinstance(candidates, list):
+                    candidates = [candidates]
+            else:
+                continue
+
+            for item in candidates:
+                if not isinstance(item, dict):
+                    continue
+                types = item.get('@type')
+                if 'JobPosting' not in (types if isinstance(types, list) else [types]):
+                    continue
+
+                detail = {}
+                if item.get('description'):
+                    detail['description'] = BeautifulSoup(item['description'], 'html.parser').get_text(' ', strip=True)
+                requirements = [
+                    text for text in (_json_ld_text(item.get(key))
+                                      for key in ('qualifications', 'skills', 'experienceRequirements'))
+                    if text
+                ]
+                if requirements:
+                    detail['requirements'] = '\n'.join(requirements)
+                if item.get('datePosted'):
+                    detail['posted_date'] = str(item['datePosted'])[:10]
+                job_type = item.get('employmentType')
+                if job_type:
+                    detail['job_type'] = ', '.join(job_type) if isinstance(job_type, list) else str(job_type)
+                return detail
+
+        return {}
+
+    def _fetch(self, url: str) -> str:
+        host = urlparse(url).netloc
+        with self._lock:
+            slots = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.per_host_limit))
+
+        with slots:
+            self._wait_for_host(host)
+            response = self.session.get(url, timeout=TIMEOUT)
+            response.raise_for_status()
+            return response.text
+
+    def _wait_for_host(self, host: str) -> None:
+        """Space out request starts against the same host"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._host_last_request.get(host, 0) + self.host_delay)
+            self._host_last_request[host] = start
+        if start > now:
+            time.sleep(start - now)
+
+    def _board_for_url(self, url: str) -> Optional[str]:
+        host = urlparse(url).netloc.lower()
+        for board in DETAIL_SELECTORS:
+            if board in host:
+                return board
+        return None
+
+    def _cache_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _read_cache(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            if url in self._memory_cache:
+                return self._memory_cache[url]
+
+        if not self.cache_dir:
+            return None
+
+        path = self._cache_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('fetched_at', 0) > self.cache_ttl:
+            return None
+
+        with self._lock:
+            self._memory_cache[url] = entry['detail']
+        return entry['detail']
+
+    def _write_cache(self, url: str, detail: Dict) -> None:
+        with self._lock:
+            self._memory_cache[url] = detail
+
+        if not self.cache_dir:
+            return
+
+        path = self._cache_path(url)
+        try:
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'fetched_at': time.time(), 'detail': detail}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache job detail page {url}: {e}")
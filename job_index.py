@@ -0,0 +1,286 @@
+import glob
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from config import (
+    JOB_STORE_DIR,
+    RESULTS_DIR,
+    SEARCH_BM25_B,
+    SEARCH_BM25_K1,
+    SEARCH_FACET_LIMIT,
+    SEARCH_TITLE_WEIGHT,
+)
+from job_delta import job_hash, job_key
+from skill_extractor import SkillExtractor
+
+logger = logging.getLogger(__name__)
+
+# Searchable fields and the job keys they appear under, across the HTTP and Selenium scrapers
+TITLE_FIELDS = ['title', 'job_title']
+TEXT_FIELDS = ['description', 'job_description', 'role_description', 'qualifications_skills', 'requirements']
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def _field_text(job: Dict, fields: List[str]) -> str:
+    return ' '.join(str(job[field]) for field in fields if job.get(field) and job[field] != 'N/A')
+
+
+def _jobs_in(data) -> List[Dict]:
+    """Jobs in a result file (a list) or a store snapshot; anything else, such as a delta, has none"""
+    if isinstance(data, list):
+        return [job for job in data if isinstance(job, dict)]
+    if isinstance(data, dict) and isinstance(data.get('jobs'), dict):
+        return [entry['job'] for entry in data['jobs'].values()]
+    return []
+
+
+def _dump_query(jobs: List[Dict]) -> Optional[Tuple[str, str]]:
+    """Board and keywords a result file was scraped for, read from its first job.
+
+    Result files do not record the searched location, so dumps of the same
+    board and keywords count as the same query.
+    """
+    if not jobs:
+        return None
+    return str(jobs[0].get('job_board', '')).lower(), str(jobs[0].get('keywords', ''))
+
+
+class JobIndex:
+    """In-memory inverted index over scraped jobs with BM25 ranking and skill facets.
+
+    Jobs are added, replaced and removed one at a time, so keeping the index
+    current only costs work for the jobs that changed. sync_store() applies
+    the job store snapshots written by crawl_scheduler.py and the latest
+    result file written by scrape_jobs.py for each query, reloading only the
+    files modified since the last sync. When several files hold the same job,
+    the store wins over result files and newer files win over older ones.
+    """
+
+    def __init__(self, store_dir: Optional[str] = JOB_STORE_DIR, results_dir: Optional[str] = RESULTS_DIR,
+                 skill_extractor: Optional[SkillExtractor] = None):
+        self.store_dir = store_dir
+        self.results_dir = results_dir
+        self.skill_extractor = skill_extractor or SkillExtractor()
+        self._lock = threading.RLock()
+
+        self.jobs = {}
+        self.hashes = {}
+        self.term_counts = {}
+        self.doc_lengths = {}
+        self.total_length = 0
+        self.postings = {}
+        self.skills = {}
+        self.skill_postings = {}
+
+        # Each indexed file's version of its jobs, its precedence, and which files hold each job
+        self.file_jobs = {}
+        self.file_ranks = {}
+        self.sources = {}
+        # When each file was last read, and the query of each result file
+        self.file_mtimes = {}
+        self.dump_queries = {}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def add(self, job: Dict) -> str:
+        """Index a job, replacing any earlier version with the same key"""
+        key = job_key(job)
+        content_hash = job_hash(job)
+        with self._lock:
+            if self.hashes.get(key) == content_hash:
+                return key
+            if key in self.jobs:
+                self._unindex(key)
+
+            terms = Counter(tokenize(_field_text(job, TEXT_FIELDS)))
+            for term in tokenize(_field_text(job, TITLE_FIELDS)):
+                terms[term] += SEARCH_TITLE_WEIGHT
+            skills = self.skill_extractor.extract(_field_text(job, TITLE_FIELDS + TEXT_FIELDS))
+
+            self.jobs[key] = job
+            self.hashes[key] = content_hash
+            self.term_counts[key] = terms
+            self.doc_lengths[key] = sum(terms.values())
+            self.total_length += self.doc_lengths[key]
+            for term, count in terms.items():
+                self.postings.setdefault(term, {})[key] = count
+            self.skills[key] = skills
+            for skill in skills:
+                self.skill_postings.setdefault(skill, set()).add(key)
+        return key
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if key in self.jobs:
+                self._unindex(key)
+                del self.jobs[key]
+                del self.hashes[key]
+
+    def _unindex(self, key: str) -> None:
+        for term in self.term_counts.pop(key):
+            postings = self.postings[term]
+            del postings[key]
+            if not postings:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(key)
+        for skill in self.skills.pop(key):
+            keys = self.skill_postings[skill]
+            keys.discard(key)
+            if not keys:
+                del self.skill_postings[skill]
+
+    def sync_store(self) -> None:
+        """Apply job files added, changed, deleted or superseded since the last sync"""
+        store_paths = self._glob(self.store_dir)
+        result_paths = self._glob(self.results_dir)
+
+        with self._lock:
+            for path in set(self.file_mtimes) - set(store_paths) - set(result_paths):
+                del self.file_mtimes[path]
+                self.dump_queries.pop(path, None)
+
+            loaded = {}
+            for path in store_paths + result_paths:
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if self.file_mtimes.get(path) == mtime:
+                    continue
+                jobs = self._read_jobs(path)
+                if jobs is None:
+                    continue
+                loaded[path] = jobs
+                self.file_mtimes[path] = mtime
+                if path in result_paths:
+                    self.dump_queries[path] = _dump_query(jobs)
+
+            # Only the latest result file of each query is indexed, so old dumps age out
+            latest = {}
+            for path in result_paths:
+                query = self.dump_queries.get(path)
+                if query is None or path not in self.file_mtimes:
+                    continue
+                if query not in latest or self.file_mtimes[path] > self.file_mtimes[latest[query]]:
+                    latest[query] = path
+
+            ranks = {path: (False, self.file_mtimes[path]) for path in latest.values()}
+            ranks.update({path: (True, self.file_mtimes[path]) for path in store_paths if path in self.file_mtimes})
+
+            changed = set()
+            for path in set(self.file_jobs) - set(ranks):
+                changed |= self._set_file_jobs(path, None)
+            for path, rank in ranks.items():
+                self.file_ranks[path] = rank
+                if path in loaded:
+                    changed |= self._set_file_jobs(path, loaded[path])
+                elif path not in self.file_jobs:
+                    # A result file that was superseded becomes the latest again
+                    changed |= self._set_file_jobs(path, self._read_jobs(path) or [])
+
+            for key in changed:
+                self._reindex(key)
+
+    def _glob(self, directory: Optional[str]) -> List[str]:
+        return sorted(glob.glob(os.path.join(directory, '*.json'))) if directory else []
+
+    def _read_jobs(self, path: str) -> Optional[List[Dict]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return _jobs_in(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load jobs from {path}: {e}")
+            return None
+
+    def _set_file_jobs(self, path: str, jobs: Optional[List[Dict]]) -> set:
+        """Replace a file's jobs (None drops the file) and return the keys affected"""
+        old = self.file_jobs.pop(path, {})
+        for key in old:
+            self.sources[key].discard(path)
+        if jobs is None:
+            self.file_ranks.pop(path, None)
+            return set(old)
+
+        new = {job_key(job): job for job in jobs}
+        self.file_jobs[path] = new
+        for key in new:
+            self.sources.setdefault(key, set()).add(path)
+        return set(old) | set(new)
+
+    def _reindex(self, key: str) -> None:
+        """Index the version of a job from the highest ranked file that still holds it"""
+        paths = self.sources.get(key)
+        if not paths:
+            self.sources.pop(key, None)
+            self.remove(key)
+            return
+        best = max(paths, key=lambda path: (self.file_ranks[path], path))
+        self.add(self.file_jobs[best][key])
+
+    def search(self, query: str = '', skills: Optional[List[str]] = None, job_board: Optional[str] = None,
+               limit: int = 20, offset: int = 0) -> Dict:
+        """BM25-ranked jobs matching any query term, narrowed by skills and board.
+
+        Returns one page of results, the total match count and skill facet
+        counts over all matches. With an empty query every job matches and
+        results are unranked.
+        """
+        with self._lock:
+            terms = list(dict.fromkeys(tokenize(query)))
+            if terms:
+                scores = self._bm25(terms)
+            else:
+                scores = dict.fromkeys(self.jobs, 0.0)
+
+            canonical = {name.lower(): name for name in self.skill_postings}
+            for skill in skills or []:
+                with_skill = self.skill_postings.get(canonical.get(skill.lower()), set())
+                scores = {key: score for key, score in scores.items() if key in with_skill}
+            if job_board:
+                board = job_board.lower()
+                scores = {key: score for key, score in scores.items()
+                          if str(self.jobs[key].get('job_board', '')).lower() == board}
+
+            facets = Counter()
+            for key in scores:
+                facets.update(self.skills[key])
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            results = []
+            for key, score in ranked[offset:offset + limit]:
+                job = dict(self.jobs[key])
+                job['score'] = round(score, 4)
+                job['skills'] = sorted(self.skills[key])
+                results.append(job)
+
+            return {
+                'total': len(scores),
+                'results': results,
+                'facets': {'skills': dict(facets.most_common(SEARCH_FACET_LIMIT))},
+            }
+
+    def _bm25(self, terms: List[str]) -> Dict[str, float]:
+        doc_count = len(self.jobs)
+        average_length = self.total_length / doc_count if doc_count else 0
+        scores = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, tf in postings.items():
+                norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * self.doc_lengths[key] / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (SEARCH_BM25_K1 + 1) / (tf + norm)
+        return scores
@@ -2,26 +2,28 @@ import os
 import time
 import json
 from datetime import datetime
-from scrapers.careers24_scraper import Careers24Scraper
-from config import JOB_BOARDS, OUTPUT_DIR, CSV_FILENAME, JSON_FILENAME
+from scrape_jobs import JobScraper
+from config import JOB_BOARDS, OUTPUT_DIR, CSV_FILENAME, JSON_FILENAME, SEARCH_PARAMS
 
 class JobScraperManager:
-    def __init__(self):
-        self.scrapers = {
-            'careers24': Careers24Scraper(),
-            # Add more scrapers as they are implemented
-        }
+    def __init__(self, max_pages: int = 1):
+        # JobScraper fetches over HTTP and only starts a browser for pages that need one
+        self.boards = [
+            'careers24',
+            # Add more boards as they are implemented
+        ]
+        self.max_pages = max_pages
         self.all_jobs = []
         
     def scrape_all_jobs(self):
         """Scrape jobs from all configured job boards"""
-        for board_name, url in JOB_BOARDS.items():
-            if board_name in self.scrapers:
+        for board_name in JOB_BOARDS:
+            if board_name in self.boards:
                 print(f"Scraping {board_name}...")
-                scraper = self.scrapers[board_name]
-                scraper.scrape_jobs(url)
-                self.all_jobs.extend(scraper.jobs)
-                print(f"Found {len(scraper.jobs)} jobs on {board_name}")
+                scraper = JobScraper(job_board=board_name, location=SEARCH_PARAMS['location'])
+                jobs = scraper.scrape(max_pages=self.max_pages)
+                self.all_jobs.extend(jobs)
+                print(f"Found {len(jobs)} jobs on {board_name}")
     
     def save_results(self):
         """Save all scraped jobs to CSV and JSON"""
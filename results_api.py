@@ -0,0 +1,165 @@
+import base64
+import binascii
+import hashlib
+import json
+import os
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import RESULTS_CACHE_SIZE, RESULTS_CHUNK_SIZE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CursorError(ValueError):
+    """Raised for cursors that are malformed or belong to an older version of a result set"""
+
+
+def result_path(results_dir: str, name: str) -> Optional[str]:
+    """Path of a result file by name, or None if the name is not a result file"""
+    if os.path.basename(name) != name or not name.endswith('.json'):
+        return None
+    path = os.path.join(results_dir, name)
+    return path if os.path.isfile(path) else None
+
+
+def result_version(path: str) -> str:
+    """Version of a result file that changes whenever the file is rewritten"""
+    stat = os.stat(path)
+    return hashlib.sha1(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')).hexdigest()[:16]
+
+
+def result_count(path: str) -> int:
+    """Number of jobs in a result file"""
+    return len(_index_results(path, os.stat(path).st_mtime_ns))
+
+
+def read_results(path: str, start: int, stop: int) -> List[Dict]:
+    """Jobs start..stop of a result file, read from disk without parsing the rest"""
+    spans = _index_results(path, os.stat(path).st_mtime_ns)[start:stop]
+    jobs = []
+    with open(path, 'rb') as f:
+        for offset, length in spans:
+            f.seek(offset)
+            jobs.append(json.loads(f.read(length)))
+    return jobs
+
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+@lru_cache(maxsize=RESULTS_CACHE_SIZE)
+def _index_results(path: str, mtime_ns: int) -> List[Tuple[int, int]]:
+    """Byte offset and length of every job in a result file.
+
+    The file is scanned once per version; only the offsets are kept, so
+    memory held between requests grows with the number of jobs rather than
+    with their size.
+    """
+    # newline='' keeps line endings as written, so character offsets map back to bytes
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(text, 0).end()
+    if text[pos:pos + 1] != '[':
+        raise ValueError(f"{os.path.basename(path)} is not a list of jobs")
+    pos = _WHITESPACE.match(text, pos + 1).end()
+
+    spans = []
+    byte_pos, char_pos = 0, 0
+    while text[pos:pos + 1] != ']':
+        job, end = decoder.raw_decode(text, pos)
+        if not isinstance(job, dict):
+            raise ValueError(f"{os.path.basename(path)} is not a list of jobs")
+
+        # Convert character offsets to byte offsets incrementally, since jobs may hold non-ASCII text
+        byte_pos += len(text[char_pos:pos].encode('utf-8'))
+        length = len(text[pos:end].encode('utf-8'))
+        spans.append((byte_pos, length))
+        byte_pos, char_pos = byte_pos + length, end
+
+        pos = _WHITESPACE.match(text, end).end()
+        if text[pos:pos + 1] == ',':
+            pos = _WHITESPACE.match(text, pos + 1).end()
+        elif text[pos:pos + 1] != ']':
+            raise ValueError(f"{os.path.basename(path)} is not valid JSON")
+    return spans
+
+
+def encode_cursor(offset: int, version: str) -> str:
+    raw = json.dumps({'o': offset, 'v': version}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, version: str) -> int:
+    """Offset a cursor points at, checked against the current result set version"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        data = json.loads(raw)
+        offset = int(data['o'])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise CursorError("Invalid cursor")
+    if data.get('v') != version or offset < 0:
+        raise CursorError("Cursor has expired, the result set has changed")
+    return offset
+
+
+def project(job: Dict, fields: Optional[List[str]]) -> Dict:
+    """Keep only the requested fields of a job"""
+    if not fields:
+        return job
+    return {field: job.get(field) for field in fields}
+
+
+def page_json(header: Dict, jobs: Iterable[Dict]) -> Iterator[str]:
+    """Encode a page object one job at a time, with the jobs array last.
+
+    header holds the other (non-empty) page fields and is written first.
+    """
+    yield json.dumps(header, ensure_ascii=False)[:-1]
+    yield ', "jobs": ['
+    for index, job in enumerate(jobs):
+        yield (', ' if index else '') + json.dumps(job, ensure_ascii=False)
+    yield ']}'
+
+
+def supported_encodings() -> List[str]:
+    """Content encodings this server can produce, most preferred first"""
+    return (['br'] if brotli else []) + ['gzip', 'identity']
+
+
+def encode_stream(pieces: Iterable[str], encoding: str) -> Iterator[bytes]:
+    """Compress text pieces into chunks without holding the whole body"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        compress, flush = compressor.process, compressor.finish
+    elif encoding == 'gzip':
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        compress, flush = compressor.compress, compressor.flush
+    else:
+        compress, flush = None, None
+
+    buffer = []
+    size = 0
+    for piece in pieces:
+        data = piece.encode('utf-8')
+        buffer.append(data)
+        size += len(data)
+        if size >= RESULTS_CHUNK_SIZE:
+            chunk = b''.join(buffer)
+            buffer, size = [], 0
+            chunk = compress(chunk) if compress else chunk
+            if chunk:
+                yield chunk
+
+    chunk = b''.join(buffer)
+    if compress:
+        chunk = compress(chunk) + flush()
+    if chunk:
+        yield chunk
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import csv
 import json
 import logging
 import os
@@ -8,15 +9,27 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
+from config import JOB_STORE_DIR
+from fetch_strategy import FetchStrategy
+from job_delta import (
+    build_snapshot,
+    compute_delta,
+    incomplete_delta,
+    load_snapshot,
+    save_snapshot,
+    scrape_failed,
+    snapshot_path,
+)
+from job_enricher import JobEnricher
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        logging.StreamHandler(sys.stderr),
         logging.FileHandler('scraper.log')
     ]
 )
@@ -35,6 +48,8 @@ class JobScraper:
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
         })
+        self.fetcher = FetchStrategy(self.session)
+        self.failed_pages = []
 
     def get_indeed_url(self, page: int = 1) -> str:
         base_url = "https://za.indeed.com/jobs"
@@ -70,10 +85,7 @@ class JobScraper:
                 url = self.get_indeed_url(page)
                 logger.info(f"Scraping Indeed page {page}: {url}")
                 
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.fetcher.fetch(self.job_board, url, 'div', 'job_seen_beacon')
                 job_cards = soup.find_all('div', class_='job_seen_beacon')
                 
                 for card in job_cards:
@@ -104,6 +116,7 @@ class JobScraper:
                 
             except Exception as e:
                 logger.error(f"Error scraping Indeed page {page}: {e}")
+                self.failed_pages.append(page)
                 continue
                 
         return jobs
@@ -115,10 +128,7 @@ class JobScraper:
                 url = self.get_careers24_url(page)
                 logger.info(f"Scraping Careers24 page {page}: {url}")
                 
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.fetcher.fetch(self.job_board, url, 'div', 'job-card')
                 job_cards = soup.find_all('div', class_='job-card')
                 
                 for card in job_cards:
@@ -150,6 +160,7 @@ class JobScraper:
                 
             except Exception as e:
                 logger.error(f"Error scraping Careers24 page {page}: {e}")
+                self.failed_pages.append(page)
                 continue
                 
         return jobs
@@ -161,10 +172,7 @@ class JobScraper:
                 url = self.get_pnet_url(page)
                 logger.info(f"Scraping PNet page {page}: {url}")
                 
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.fetcher.fetch(self.job_board, url, 'div', 'job-item')
                 job_cards = soup.find_all('div', class_='job-item')
                 
                 for card in job_cards:
@@ -196,19 +204,26 @@ class JobScraper:
                 
             except Exception as e:
                 logger.error(f"Error scraping PNet page {page}: {e}")
+                self.failed_pages.append(page)
                 continue
                 
         return jobs
 
     def scrape(self, max_pages: int = 1) -> List[Dict]:
-        if self.job_board == 'indeed':
-            return self.scrape_indeed(max_pages)
-        elif self.job_board == 'careers24':
-            return self.scrape_careers24(max_pages)
-        elif self.job_board == 'pnet':
-            return self.scrape_pnet(max_pages)
-        else:
-            raise ValueError(f"Unsupported job board: {self.job_board}")
+        """Scrape up to max_pages listing pages; pages that errored are left in failed_pages"""
+        self.failed_pages = []
+        try:
+            if self.job_board == 'indeed':
+                return self.scrape_indeed(max_pages)
+            elif self.job_board == 'careers24':
+                return self.scrape_careers24(max_pages)
+            elif self.job_board == 'pnet':
+                return self.scrape_pnet(max_pages)
+            else:
+                raise ValueError(f"Unsupported job board: {self.job_board}")
+        finally:
+            # Shut down the browser if any page needed one
+            self.fetcher.close()
 
 def save_to_json(jobs: List[Dict], output_path: str) -> None:
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -224,6 +239,21 @@ def save_to_csv(jobs: List[Dict], output_path: str) -> None:
         writer.writeheader()
         writer.writerows(jobs)
 
+def load_fresh_jobs(path: str, query: Dict, max_age: int, max_pages: int = 1, enrich: bool = False) -> Optional[List[Dict]]:
+    """Jobs from a stored snapshot of query, or None if it is missing, older than
+    max_age seconds, or covers fewer pages or less detail than the request asks for"""
+    snapshot = load_snapshot(path, query)
+    if not snapshot:
+        return None
+    query = snapshot.get('query', {})
+    if query.get('max_pages', 1) < max_pages or (enrich and not query.get('enriched')):
+        return None
+    age = (datetime.now() - datetime.fromisoformat(snapshot['updated_at'])).total_seconds()
+    if age > max_age:
+        return None
+    logger.info(f"Serving {len(snapshot['jobs'])} jobs from job store, crawled {age / 60:.0f} minutes ago")
+    return [entry['job'] for entry in snapshot['jobs'].values()]
+
 def main():
     parser = argparse.ArgumentParser(description='Job Scraper')
     parser.add_argument('--job-board', required=True, help='Job board to scrape (indeed, careers24, pnet)')
@@ -233,6 +263,14 @@ def main():
     parser.add_argument('--output-dir', required=True, help='Directory to save results')
     parser.add_argument('--csv-filename', required=True, help='CSV output filename')
     parser.add_argument('--json-filename', required=True, help='JSON output filename')
+    parser.add_argument('--enrich', action='store_true', help='Fetch job detail pages to fill in requirements, description, posted date and job type')
+    parser.add_argument('--delta', action='store_true', help='Compare against the previous run of this query and save the added, updated and removed jobs')
+    parser.add_argument('--delta-only', action='store_true', help='Skip the full JSON/CSV dump and print only the delta to stdout (implies --delta)')
+    parser.add_argument('--delta-filename', help='Delta output filename (defaults to the JSON filename with a _delta suffix)')
+    parser.add_argument('--snapshot-dir', help='Directory holding the per-query snapshots (defaults to <output-dir>/snapshots)')
+    parser.add_argument('--summary', action='store_true', help='Print only the job count and result file names instead of the full job list')
+    parser.add_argument('--max-age', type=int, help='Serve results from the job store if its snapshot is at most this many seconds old instead of scraping (ignored with --delta)')
+    parser.add_argument('--store-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), JOB_STORE_DIR), help='Job store kept warm by crawl_scheduler.py')
     
     args = parser.parse_args()
     
@@ -240,29 +278,82 @@ def main():
         # Create output directory if it doesn't exist
         os.makedirs(args.output_dir, exist_ok=True)
         
-        # Initialize scraper
-        scraper = JobScraper(
-            job_board=args.job_board,
-            location=args.location,
-            keywords=args.keywords
-        )
+        snapshot_dir = args.snapshot_dir or os.path.join(args.output_dir, 'snapshots')
+        path = snapshot_path(snapshot_dir, args.job_board, args.location, args.keywords)
+        query = {
+            'job_board': args.job_board,
+            'location': args.location,
+            'keywords': args.keywords,
+            'enriched': args.enrich
+        }
         
-        # Scrape jobs
-        logger.info(f"Starting scraping for {args.job_board} in {args.location}")
-        jobs = scraper.scrape(max_pages=args.max_pages)
-        logger.info(f"Found {len(jobs)} jobs")
+        # Use the job store kept warm by the crawl scheduler when it is fresh enough
+        jobs = None
+        failed_pages = []
+        if args.max_age is not None and not (args.delta or args.delta_only):
+            store_path = snapshot_path(args.store_dir, args.job_board, args.location, args.keywords)
+            jobs = load_fresh_jobs(store_path, query, args.max_age, max_pages=args.max_pages, enrich=args.enrich)
         
-        # Save results
-        json_path = os.path.join(args.output_dir, args.json_filename)
-        csv_path = os.path.join(args.output_dir, args.csv_filename)
+        if jobs is None:
+            # Initialize scraper
+            scraper = JobScraper(
+                job_board=args.job_board,
+                location=args.location,
+                keywords=args.keywords
+            )
+            
+            # Scrape jobs
+            logger.info(f"Starting scraping for {args.job_board} in {args.location}")
+            jobs = scraper.scrape(max_pages=args.max_pages)
+            failed_pages = scraper.failed_pages
+            logger.info(f"Found {len(jobs)} jobs")
+            
+            # Fill in fields only available on the job detail pages
+            if args.enrich:
+                JobEnricher(headers=dict(scraper.session.headers)).enrich(jobs)
         
-        save_to_json(jobs, json_path)
-        save_to_csv(jobs, csv_path)
+        # Save results
+        if not args.delta_only:
+            json_path = os.path.join(args.output_dir, args.json_filename)
+            csv_path = os.path.join(args.output_dir, args.csv_filename)
+            
+            save_to_json(jobs, json_path)
+            save_to_csv(jobs, csv_path)
+            
+            logger.info(f"Results saved to:\nJSON: {json_path}\nCSV: {csv_path}")
         
-        logger.info(f"Results saved to:\nJSON: {json_path}\nCSV: {csv_path}")
+        # Compare against the previous run of the same query
+        delta = None
+        if args.delta or args.delta_only:
+            previous = load_snapshot(path, query)
+            if scrape_failed(jobs, failed_pages, previous):
+                # Keep the previous baseline so a partial scrape does not show up as churn
+                logger.warning("Scrape was incomplete, skipping the delta and keeping the previous snapshot")
+                delta = incomplete_delta(query, previous, failed_pages)
+            else:
+                snapshot = build_snapshot(jobs, query=query)
+                delta = compute_delta(previous, snapshot)
+                save_snapshot(snapshot, path)
+            
+            delta_filename = args.delta_filename or os.path.splitext(args.json_filename)[0] + '_delta.json'
+            delta_path = os.path.join(args.output_dir, delta_filename)
+            save_to_json(delta, delta_path)
+            
+            logger.info(f"Delta: {len(delta['added'])} added, {len(delta['updated'])} updated, "
+                        f"{len(delta['removed'])} removed. Saved to: {delta_path}")
         
         # Print JSON for PHP to capture
-        print(json.dumps(jobs))
+        if args.delta_only:
+            print(json.dumps(delta))
+        elif args.summary:
+            # The jobs themselves are served page by page from the results API in app.py
+            print(json.dumps({
+                'total_jobs': len(jobs),
+                'json_file': args.json_filename,
+                'csv_file': args.csv_filename
+            }))
+        else:
+            print(json.dumps(jobs))
         
     except Exception as e:
         logger.error(f"Error: {e}")
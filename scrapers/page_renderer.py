@@ -0,0 +1,19 @@
+from .base_scraper import BaseScraper
+from selenium.webdriver.common.by import By
+import logging
+
+class PageRenderer(BaseScraper):
+    """Headless browser used to render pages that need JavaScript"""
+
+    def scrape_jobs(self, url):
+        """Return the rendered HTML of a page"""
+        return self.render(url)
+
+    def render(self, url, wait_class=None):
+        """Load a page and return its HTML once the given class is present"""
+        logging.info(f"Rendering page in browser: {url}")
+        self.driver.get(url)
+        if wait_class:
+            if not self.wait_for_element(By.CLASS_NAME, wait_class):
+                logging.warning(f"No '{wait_class}' elements after rendering {url}")
+        return self.driver.page_source
@@ -0,0 +1,73 @@
+from collections import deque
+from typing import Dict, List, Set
+
+from config import SKILLS
+
+
+class SkillExtractor:
+    """Find dictionary skills in text in a single pass.
+
+    All skill aliases are compiled into one Aho-Corasick automaton, so the
+    cost of a scan depends on the length of the text rather than on the size
+    of the skills dictionary. Matches must sit on word boundaries, so "Java"
+    is not found inside "JavaScript".
+    """
+
+    def __init__(self, skills: Dict[str, List[str]] = SKILLS):
+        # State 0 is the root; each state has transitions, a failure link and output skills
+        self.transitions = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+
+        for skill, aliases in skills.items():
+            for alias in aliases:
+                self._add_pattern(alias.lower(), skill)
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, skill: str) -> None:
+        state = 0
+        for char in pattern:
+            if char not in self.transitions[state]:
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.transitions[state][char] = len(self.transitions) - 1
+            state = self.transitions[state][char]
+        self.outputs[state].append((skill, len(pattern)))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.transitions[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.transitions[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def extract(self, text: str) -> Set[str]:
+        """Canonical names of the skills mentioned in text"""
+        found = set()
+        if not text:
+            return found
+
+        text = text.lower()
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(char, 0)
+
+            for skill, length in self.outputs[state]:
+                if skill in found:
+                    continue
+                start = end - length + 1
+                before = text[start - 1] if start > 0 else ' '
+                after = text[end + 1] if end + 1 < len(text) else ' '
+                if not before.isalnum() and not (after.isalnum() or after in '+#'):
+                    found.add(skill)
+        return found
@@ -0,0 +1,100 @@
+import pytest
+
+from config import (
+    SCHEDULER_BOARD_SPACING,
+    SCHEDULER_DEFAULT_INTERVAL,
+    SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_TARGET_NEW_JOBS,
+)
+from crawl_scheduler import RATE_SMOOTHING, CrawlScheduler, query_key
+
+PNET = {'job_board': 'pnet', 'location': 'Cape Town', 'keywords': 'python'}
+PNET_JAVA = {'job_board': 'pnet', 'location': 'Cape Town', 'keywords': 'java'}
+INDEED = {'job_board': 'indeed', 'location': 'Johannesburg', 'keywords': 'python'}
+
+HOUR = 3600
+NOW = 1_000_000.0
+
+
+def make_scheduler(*queries):
+    return CrawlScheduler(queries=list(queries) or [PNET], store_dir=None, state_path=None)
+
+
+def test_first_crawl_uses_default_interval():
+    scheduler = make_scheduler(PNET)
+    key = query_key(PNET)
+    assert scheduler.due_queries(NOW) == [key]
+
+    scheduler.record_crawl(key, None, now=NOW)
+    assert scheduler.state[key] == {
+        'last_crawl': NOW,
+        'rate': 0.0,
+        'interval': SCHEDULER_DEFAULT_INTERVAL,
+        'next_due': NOW + SCHEDULER_DEFAULT_INTERVAL,
+    }
+    assert scheduler.due_queries(NOW + 1) == []
+
+
+def test_rate_is_smoothed_and_sets_interval():
+    scheduler = make_scheduler(PNET)
+    key = query_key(PNET)
+    scheduler.state[key] = {'last_crawl': NOW, 'rate': 2.0, 'interval': HOUR, 'next_due': NOW + HOUR}
+
+    scheduler.record_crawl(key, 8, now=NOW + 2 * HOUR)
+    rate = RATE_SMOOTHING * 4.0 + (1 - RATE_SMOOTHING) * 2.0
+    assert scheduler.state[key]['rate'] == pytest.approx(rate)
+    assert scheduler.state[key]['interval'] == pytest.approx(SCHEDULER_TARGET_NEW_JOBS / rate * HOUR)
+
+
+@pytest.mark.parametrize('new_jobs, interval', [(10_000, SCHEDULER_MIN_INTERVAL), (0, SCHEDULER_MAX_INTERVAL)])
+def test_interval_is_clamped(new_jobs, interval):
+    scheduler = make_scheduler(PNET)
+    key = query_key(PNET)
+    scheduler.state[key] = {'last_crawl': NOW, 'rate': 0.0, 'interval': SCHEDULER_MAX_INTERVAL, 'next_due': NOW}
+
+    scheduler.record_crawl(key, new_jobs, now=NOW + HOUR)
+    assert scheduler.state[key]['interval'] == interval
+
+
+def test_crawls_of_the_same_board_are_spaced():
+    scheduler = make_scheduler(PNET, PNET_JAVA, INDEED)
+    scheduler.record_crawl(query_key(PNET), None, now=NOW)
+
+    # The other pnet query is due but has to wait for the board spacing
+    assert scheduler.next_query(NOW + 1) == query_key(INDEED)
+    scheduler.record_crawl(query_key(INDEED), None, now=NOW + 1)
+    assert scheduler.next_query(NOW + 2) is None
+    assert scheduler.seconds_until_next(NOW + 2) == pytest.approx(SCHEDULER_BOARD_SPACING['pnet'] - 2)
+    assert scheduler.next_query(NOW + SCHEDULER_BOARD_SPACING['pnet']) == query_key(PNET_JAVA)
+
+
+def test_due_queries_are_ordered_by_expected_new_jobs():
+    scheduler = make_scheduler(PNET, PNET_JAVA)
+    scheduler.state[query_key(PNET)] = {'last_crawl': NOW, 'rate': 1.0, 'interval': HOUR, 'next_due': NOW}
+    scheduler.state[query_key(PNET_JAVA)] = {'last_crawl': NOW, 'rate': 3.0, 'interval': HOUR, 'next_due': NOW}
+    assert scheduler.due_queries(NOW + HOUR) == [query_key(PNET_JAVA), query_key(PNET)]
+
+
+def test_failure_keeps_last_crawl_and_rate():
+    scheduler = make_scheduler(PNET)
+    key = query_key(PNET)
+    scheduler.state[key] = {'last_crawl': NOW, 'rate': 2.0, 'interval': 2 * HOUR, 'next_due': NOW + 2 * HOUR}
+
+    scheduler.record_failure(key, now=NOW + 2 * HOUR)
+    assert scheduler.state[key] == {'last_crawl': NOW, 'rate': 2.0, 'interval': 2 * HOUR, 'next_due': NOW + 4 * HOUR}
+
+    # The next good crawl measures churn over the whole gap
+    scheduler.record_crawl(key, 16, now=NOW + 4 * HOUR)
+    assert scheduler.state[key]['rate'] == pytest.approx(RATE_SMOOTHING * 4.0 + (1 - RATE_SMOOTHING) * 2.0)
+
+
+def test_failed_first_crawl_is_retried_and_stays_urgent():
+    scheduler = make_scheduler(PNET)
+    key = query_key(PNET)
+    scheduler.record_failure(key, now=NOW)
+    assert scheduler.due_queries(NOW + 1) == []
+    assert scheduler.expected_new_jobs(key, NOW + 1) == float('inf')
+
+    scheduler.record_crawl(key, None, now=NOW + SCHEDULER_DEFAULT_INTERVAL)
+    assert scheduler.state[key]['last_crawl'] == NOW + SCHEDULER_DEFAULT_INTERVAL
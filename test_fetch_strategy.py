@@ -0,0 +1,133 @@
+import time
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from fetch_strategy import BROWSER, HTTP, NO_JOB_CARDS, FetchStrategy
+
+JOB_PAGE = '<html><body><div class="job-card">Python Developer</div></body></html>'
+EMPTY_PAGE = '<html><body><h1>Jobs</h1></body></html>'
+NO_RESULTS_PAGE = '<html><body><p>No jobs were found for your search</p></body></html>'
+SHELL_PAGE = '<html><body><div id="root"></div><noscript>Please enable JavaScript</noscript></body></html>'
+
+
+class StubResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class StubSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = 0
+
+    def get(self, url, timeout=None):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+class StubRenderer:
+    def __init__(self, html):
+        self.html = html
+        self.renders = 0
+
+    def render(self, url, wait_class=None):
+        self.renders += 1
+        return self.html
+
+    def close(self):
+        pass
+
+
+class FailingRenderer(StubRenderer):
+    def render(self, url, wait_class=None):
+        raise RuntimeError('Chrome failed to start')
+
+
+def make_strategy(*responses, rendered=JOB_PAGE):
+    strategy = FetchStrategy(StubSession(*responses), state_path=None)
+    strategy.renderer = StubRenderer(rendered)
+    return strategy
+
+
+def fetch(strategy):
+    return strategy.fetch('careers24', 'https://www.careers24.com/jobs', 'div', 'job-card')
+
+
+def test_needs_browser():
+    strategy = make_strategy()
+    for html, reason in [(JOB_PAGE, None), (NO_RESULTS_PAGE, None), (EMPTY_PAGE, NO_JOB_CARDS),
+                         ('<p>Showing 10 of 120 jobs</p>', NO_JOB_CARDS)]:
+        assert strategy.needs_browser(html, BeautifulSoup(html, 'html.parser'), 'div', 'job-card') == reason
+    assert strategy.needs_browser(SHELL_PAGE, BeautifulSoup(SHELL_PAGE, 'html.parser'), 'div', 'job-card')
+
+
+def test_job_cards_over_http_skip_the_browser():
+    strategy = make_strategy(StubResponse(JOB_PAGE))
+    assert fetch(strategy).find('div', class_='job-card')
+    assert strategy.renderer.renders == 0
+    assert strategy.state['careers24']['mode'] == HTTP
+
+
+def test_shell_page_falls_back_to_browser_and_is_remembered():
+    strategy = make_strategy(StubResponse(SHELL_PAGE))
+    assert fetch(strategy).find('div', class_='job-card')
+    assert strategy.renderer.renders == 1
+    assert strategy.mode_for('careers24') == BROWSER
+
+    # Later pages go straight to the browser
+    fetch(strategy)
+    assert strategy.session.requests == 1
+    assert strategy.renderer.renders == 2
+
+
+def test_browser_mode_is_rechecked_over_http_after_the_interval():
+    strategy = make_strategy()
+    strategy.state['careers24'] = {'mode': BROWSER, 'checked_at': time.time() - strategy.recheck_interval - 1}
+    assert strategy.mode_for('careers24') == HTTP
+
+
+def test_empty_render_is_remembered_as_http():
+    strategy = make_strategy(StubResponse(EMPTY_PAGE), StubResponse(EMPTY_PAGE), rendered=EMPTY_PAGE)
+    fetch(strategy)
+    assert strategy.renderer.renders == 1
+    assert strategy.http_confirmed('careers24')
+
+    # An empty page from a board confirmed to work over HTTP does not start the browser again
+    fetch(strategy)
+    assert strategy.renderer.renders == 1
+
+
+def test_no_results_page_stays_on_http():
+    strategy = make_strategy(StubResponse(NO_RESULTS_PAGE))
+    fetch(strategy)
+    assert strategy.renderer.renders == 0
+    assert strategy.http_confirmed('careers24')
+
+
+@pytest.mark.parametrize('status', [403, 503])
+def test_challenge_status_is_rendered(status):
+    strategy = make_strategy(StubResponse(SHELL_PAGE, status_code=status))
+    assert fetch(strategy).find('div', class_='job-card')
+    assert strategy.mode_for('careers24') == BROWSER
+
+
+def test_challenge_is_raised_when_the_render_fails():
+    strategy = make_strategy(StubResponse(SHELL_PAGE, status_code=403))
+    strategy.renderer = FailingRenderer(None)
+    with pytest.raises(requests.HTTPError):
+        fetch(strategy)
+    assert 'careers24' not in strategy.state
+
+
+def test_plain_error_status_is_raised():
+    strategy = make_strategy(StubResponse('Forbidden', status_code=403))
+    with pytest.raises(requests.HTTPError):
+        fetch(strategy)
+    assert strategy.renderer.renders == 0
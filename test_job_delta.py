@@ -0,0 +1,95 @@
+from job_delta import (
+    build_snapshot,
+    compute_delta,
+    job_key,
+    load_snapshot,
+    save_snapshot,
+    scrape_failed,
+    snapshot_path,
+)
+
+
+def make_job(url, **fields):
+    job = {'url': url, 'title': 'Python Developer', 'company': 'Acme', 'location': 'Cape Town',
+           'description': 'Snippet', 'job_board': 'PNet', 'keywords': 'python'}
+    job.update(fields)
+    return job
+
+
+def test_job_key_uses_url():
+    assert job_key(make_job('https://example.com/1')) == 'https://example.com/1'
+
+
+def test_job_key_without_url_is_stable_and_ignores_other_fields():
+    first = make_job('N/A', salary='R10')
+    second = make_job('N/A', salary='R20')
+    assert job_key(first) == job_key(second)
+    assert job_key(first) != job_key(make_job('N/A', title='Java Developer'))
+
+
+def test_first_run_reports_everything_added():
+    delta = compute_delta(None, build_snapshot([make_job('u1'), make_job('u2')]))
+    assert [job['url'] for job in delta['added']] == ['u1', 'u2']
+    assert delta['updated'] == [] and delta['removed'] == []
+    assert delta['complete']
+
+
+def test_added_updated_removed_and_unchanged():
+    previous = build_snapshot([make_job('u1'), make_job('u2'), make_job('u3')])
+    current = build_snapshot([make_job('u1'), make_job('u2', title='Senior Python Developer'), make_job('u4')])
+    delta = compute_delta(previous, current)
+
+    assert [job['url'] for job in delta['added']] == ['u4']
+    assert delta['updated'] == [{
+        'key': 'u2',
+        'url': 'u2',
+        'changed_fields': {'title': {'old': 'Python Developer', 'new': 'Senior Python Developer'}},
+    }]
+    assert [job['key'] for job in delta['removed']] == ['u3']
+    assert delta['unchanged'] == 1
+
+
+def test_keywords_never_count_as_a_change():
+    previous = build_snapshot([make_job('u1', keywords='python')])
+    current = build_snapshot([make_job('u1', keywords='developer')])
+    delta = compute_delta(previous, current)
+    assert delta['updated'] == [] and delta['unchanged'] == 1
+
+
+def test_detail_fields_ignored_when_enrichment_differs():
+    enriched = make_job('u1', description='Full description', requirements='SQL', job_type='Contract')
+    previous = build_snapshot([enriched], query={'enriched': True})
+    current = build_snapshot([make_job('u1')], query={'enriched': False})
+    delta = compute_delta(previous, current)
+    assert delta['updated'] == [] and delta['unchanged'] == 1
+
+
+def test_detail_fields_compared_when_both_runs_enriched():
+    previous = build_snapshot([make_job('u1', job_type='Contract')], query={'enriched': True})
+    current = build_snapshot([make_job('u1', job_type='Permanent')], query={'enriched': True})
+    delta = compute_delta(previous, current)
+    assert delta['updated'][0]['changed_fields'] == {'job_type': {'old': 'Contract', 'new': 'Permanent'}}
+
+
+def test_scrape_failed():
+    previous = build_snapshot([make_job('u1')])
+    assert scrape_failed([make_job('u1')], [2], previous)
+    assert scrape_failed([], [], previous)
+    assert not scrape_failed([], [], build_snapshot([]))
+    assert not scrape_failed([], [], None)
+    assert not scrape_failed([make_job('u1')], [], previous)
+
+
+def test_snapshot_path_keeps_queries_that_slug_alike_apart():
+    paths = {snapshot_path('snapshots', 'pnet', 'Cape Town', keywords) for keywords in ('C#', 'C++', 'C')}
+    assert len(paths) == 3
+    assert snapshot_path('snapshots', 'PNet', 'Cape Town', 'C#') == snapshot_path('snapshots', 'pnet', 'Cape Town', 'C#')
+
+
+def test_load_snapshot_ignores_other_queries(tmp_path):
+    path = str(tmp_path / 'snapshot.json')
+    save_snapshot(build_snapshot([make_job('u1')], query={'job_board': 'pnet', 'location': 'Cape Town', 'keywords': 'C#'}), path)
+
+    assert load_snapshot(path, {'job_board': 'PNet', 'location': 'Cape Town', 'keywords': 'C#'})
+    assert load_snapshot(path, {'job_board': 'pnet', 'location': 'Cape Town', 'keywords': 'C++'}) is None
+    assert load_snapshot(path)
@@ -0,0 +1,80 @@
+import json
+
+from job_enricher import JobEnricher
+
+
+def make_enricher(tmp_path=None):
+    return JobEnricher(cache_dir=str(tmp_path) if tmp_path else None)
+
+
+def json_ld(data):
+    return f'<html><script type="application/ld+json">{json.dumps(data)}</script></html>'
+
+
+def test_parse_json_ld_job_posting():
+    html = json_ld({
+        '@type': 'JobPosting',
+        'description': '<p>Build <b>APIs</b></p>',
+        'qualifications': 'BSc Computer Science',
+        'datePosted': '2025-06-10T08:00:00',
+        'employmentType': ['FULL_TIME', 'CONTRACTOR'],
+    })
+    assert make_enricher().parse_detail_page(html) == {
+        'description': 'Build APIs',
+        'requirements': 'BSc Computer Science',
+        'posted_date': '2025-06-10',
+        'job_type': 'FULL_TIME, CONTRACTOR',
+    }
+
+
+def test_parse_json_ld_graph_and_list_type():
+    html = json_ld({'@graph': [
+        {'@type': 'Organization', 'name': 'Acme'},
+        {'@type': ['JobPosting'], 'employmentType': 'PART_TIME'},
+    ]})
+    assert make_enricher().parse_detail_page(html) == {'job_type': 'PART_TIME'}
+
+
+def test_parse_json_ld_requirements_from_lists_and_objects():
+    html = json_ld({
+        '@type': 'JobPosting',
+        'skills': ['Python', 'SQL'],
+        'experienceRequirements': {'@type': 'OccupationalExperienceRequirements', 'description': '3 years'},
+        'qualifications': {'@type': 'EducationalOccupationalCredential', 'name': 'Matric'},
+    })
+    assert make_enricher().parse_detail_page(html)['requirements'] == 'Matric\nPython, SQL\n3 years'
+
+
+def test_selector_fallback_after_unusable_json_ld():
+    html = ('<script type="application/ld+json">"x"</script>'
+            '<div class="job-description">Full description</div><div class="job-type">Contract</div>')
+    assert make_enricher().parse_detail_page(html, 'pnet') == {
+        'description': 'Full description',
+        'job_type': 'Contract',
+    }
+
+
+def test_merge_details_keeps_longer_description():
+    enricher = make_enricher()
+    job = {'description': 'A long listing description', 'requirements': 'N/A', 'posted_date': '2025-06-01'}
+    enricher.merge_details(job, {'description': 'Short', 'requirements': 'SQL'})
+    assert job == {
+        'description': 'A long listing description',
+        'requirements': 'SQL',
+        'posted_date': '2025-06-01',
+        'job_type': 'N/A',
+    }
+
+    enricher.merge_details(job, {'description': 'A much longer description from the detail page'})
+    assert job['description'] == 'A much longer description from the detail page'
+
+
+def test_empty_parse_is_not_cached(tmp_path):
+    enricher = make_enricher(tmp_path)
+    enricher._fetch = lambda url: '<html>Please accept cookies</html>'
+    assert enricher.get_details('https://www.pnet.co.za/jobs/1') == {}
+    assert list(tmp_path.iterdir()) == []
+
+    enricher._fetch = lambda url: '<div class="job-type">Contract</div>'
+    assert enricher.get_details('https://www.pnet.co.za/jobs/1') == {'job_type': 'Contract'}
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,121 @@
+import json
+import os
+
+from job_delta import build_snapshot
+from job_index import JobIndex
+from skill_extractor import SkillExtractor
+
+SKILLS = {'Python': ['python'], 'SQL': ['sql'], 'Excel': ['excel']}
+
+
+def make_index(tmp_path=None):
+    if tmp_path is None:
+        return JobIndex(store_dir=None, results_dir=None, skill_extractor=SkillExtractor(SKILLS))
+    (tmp_path / 'store').mkdir(exist_ok=True)
+    return JobIndex(store_dir=str(tmp_path / 'store'), results_dir=str(tmp_path),
+                    skill_extractor=SkillExtractor(SKILLS))
+
+
+def make_job(url, title, description, job_board='PNet', keywords='python'):
+    return {'url': url, 'title': title, 'description': description, 'job_board': job_board, 'keywords': keywords}
+
+
+def write_jobs(path, data, mtime):
+    path.write_text(json.dumps(data))
+    os.utime(path, (mtime, mtime))
+
+
+def test_add_and_search_ranks_title_matches_first():
+    index = make_index()
+    index.add(make_job('u1', 'Data Analyst', 'Python scripting for reports'))
+    index.add(make_job('u2', 'Python Developer', 'Backend services with SQL'))
+    index.add(make_job('u3', 'Accountant', 'Excel and bookkeeping'))
+
+    result = index.search('python')
+    assert result['total'] == 2
+    assert [job['url'] for job in result['results']] == ['u2', 'u1']
+    assert result['facets']['skills'] == {'Python': 2, 'SQL': 1}
+
+
+def test_replace_updates_terms_and_skills():
+    index = make_index()
+    index.add(make_job('u1', 'Python Developer', 'Django'))
+    index.add(make_job('u1', 'Excel Analyst', 'Reporting'))
+
+    assert len(index) == 1
+    assert index.search('python')['total'] == 0
+    assert index.search('excel')['results'][0]['skills'] == ['Excel']
+    assert 'python' not in index.postings
+    assert 'Python' not in index.skill_postings
+
+
+def test_remove_clears_postings():
+    index = make_index()
+    index.add(make_job('u1', 'Python Developer', 'SQL'))
+    index.remove('u1')
+
+    assert len(index) == 0
+    assert index.postings == {} and index.skill_postings == {}
+    assert index.total_length == 0
+    assert index.search('')['total'] == 0
+
+
+def test_skill_and_board_filters_ignore_case():
+    index = make_index()
+    index.add(make_job('u1', 'Python Developer', 'SQL', job_board='Indeed'))
+    index.add(make_job('u2', 'Data Analyst', 'SQL and Excel', job_board='PNet'))
+
+    assert index.search(skills=['sql'])['total'] == 2
+    assert [job['url'] for job in index.search(skills=['SQL'], job_board='indeed')['results']] == ['u1']
+
+
+def test_sync_store_reads_result_files_and_snapshots(tmp_path):
+    index = make_index(tmp_path)
+    results_file = tmp_path / 'jobs_1.json'
+    write_jobs(results_file, [make_job('u1', 'Python Developer', 'SQL')], 100)
+    write_jobs(tmp_path / 'jobs_1_delta.json', {'added': [], 'removed': []}, 100)
+    snapshot = build_snapshot([make_job('u1', 'Python Developer', 'SQL'), make_job('u2', 'Analyst', 'Excel')])
+    write_jobs(tmp_path / 'store' / 'pnet.json', snapshot, 200)
+
+    index.sync_store()
+    assert len(index) == 2
+
+    # u1 is still held by the result file after it leaves the snapshot
+    write_jobs(tmp_path / 'store' / 'pnet.json', build_snapshot([]), 300)
+    index.sync_store()
+    assert sorted(index.jobs) == ['u1']
+
+    results_file.unlink()
+    index.sync_store()
+    assert len(index) == 0
+
+
+def test_store_version_wins_and_remaining_version_returns_on_delete(tmp_path):
+    index = make_index(tmp_path)
+    store_file = tmp_path / 'store' / 'pnet.json'
+    write_jobs(store_file, build_snapshot([make_job('u1', 'Senior Python Developer', 'SQL')]), 100)
+    # A result file written after the crawl still loses to the store
+    write_jobs(tmp_path / 'jobs_1.json', [make_job('u1', 'Python Developer', 'SQL')], 200)
+
+    index.sync_store()
+    assert index.jobs['u1']['title'] == 'Senior Python Developer'
+
+    store_file.unlink()
+    index.sync_store()
+    assert index.jobs['u1']['title'] == 'Python Developer'
+    assert index.search('senior')['total'] == 0
+
+
+def test_only_latest_result_file_per_query_is_indexed(tmp_path):
+    index = make_index(tmp_path)
+    write_jobs(tmp_path / 'jobs_1.json', [make_job('u1', 'Python Developer', 'SQL')], 100)
+    write_jobs(tmp_path / 'jobs_2.json', [make_job('u2', 'Python Engineer', 'SQL')], 200)
+    write_jobs(tmp_path / 'jobs_3.json', [make_job('u3', 'Accountant', 'Excel', keywords='excel')], 50)
+
+    index.sync_store()
+    assert sorted(index.jobs) == ['u2', 'u3']
+
+    # The older dump of the query is indexed again once the newer one is gone
+    (tmp_path / 'jobs_2.json').unlink()
+    index.sync_store()
+    assert sorted(index.jobs) == ['u1', 'u3']
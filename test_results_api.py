@@ -0,0 +1,117 @@
+import gzip
+import json
+import os
+
+import pytest
+
+import app as app_module
+from results_api import (
+    CursorError,
+    decode_cursor,
+    encode_cursor,
+    read_results,
+    result_count,
+    result_version,
+)
+
+JOBS = [
+    {'title': 'Développeur Python', 'company': 'Café Ltd', 'location': 'Cape Town', 'url': 'u1'},
+    {'title': 'Data Analyst – SQL', 'company': 'Acme', 'location': 'Durban', 'url': 'u2'},
+    {'title': 'Accountant', 'company': 'Ñandú Finance', 'location': 'Pretoria', 'url': 'u3'},
+]
+
+
+def write_results(path, data, mtime_ns=10 ** 18, crlf=False):
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    if crlf:
+        text = text.replace('\n', '\r\n')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, 'RESULTS_PATH', str(tmp_path))
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize('crlf', [False, True])
+def test_read_results_with_non_ascii_text(tmp_path, crlf):
+    path = write_results(tmp_path / 'jobs.json', JOBS, crlf=crlf)
+    assert result_count(path) == 3
+    assert read_results(path, 0, 3) == JOBS
+    assert read_results(path, 1, 2) == JOBS[1:2]
+    assert read_results(path, 2, 10) == JOBS[2:]
+
+
+def test_empty_and_non_list_files(tmp_path):
+    empty = write_results(tmp_path / 'empty.json', [])
+    assert result_count(empty) == 0
+    assert read_results(empty, 0, 10) == []
+
+    delta = write_results(tmp_path / 'delta.json', {'added': [], 'removed': []})
+    with pytest.raises(ValueError):
+        result_count(delta)
+
+
+def test_cursor_round_trip_and_expiry(tmp_path):
+    path = write_results(tmp_path / 'jobs.json', JOBS)
+    version = result_version(path)
+    assert decode_cursor(encode_cursor(2, version), version) == 2
+
+    with pytest.raises(CursorError):
+        decode_cursor('not a cursor', version)
+
+    write_results(path, JOBS[:2], mtime_ns=2 * 10 ** 18)
+    with pytest.raises(CursorError):
+        decode_cursor(encode_cursor(2, version), result_version(path))
+
+
+def test_results_route_pages_with_cursor(tmp_path, client):
+    write_results(tmp_path / 'jobs.json', JOBS, crlf=True)
+
+    first = client.get('/results/jobs.json?limit=2&fields=title,url').get_json()
+    assert first['total'] == 3 and first['count'] == 2
+    assert first['jobs'] == [{'title': job['title'], 'url': job['url']} for job in JOBS[:2]]
+
+    second = client.get(f"/results/jobs.json?limit=2&fields=title,url&cursor={first['next_cursor']}").get_json()
+    assert second['offset'] == 2
+    assert second['jobs'] == [{'title': JOBS[2]['title'], 'url': JOBS[2]['url']}]
+    assert second['next_cursor'] is None
+
+
+def test_results_route_rejects_expired_cursor_and_non_list_files(tmp_path, client):
+    path = write_results(tmp_path / 'jobs.json', JOBS)
+    cursor = client.get('/results/jobs.json?limit=1').get_json()['next_cursor']
+    write_results(path, JOBS[:2], mtime_ns=2 * 10 ** 18)
+    assert client.get(f'/results/jobs.json?limit=1&cursor={cursor}').status_code == 400
+
+    write_results(tmp_path / 'jobs_delta.json', {'added': [], 'removed': []})
+    assert client.get('/results/jobs_delta.json').status_code == 400
+    assert client.get('/results/missing.json').status_code == 404
+
+
+def test_results_route_revalidates_with_etag(tmp_path, client):
+    write_results(tmp_path / 'jobs.json', JOBS)
+    response = client.get('/results/jobs.json')
+    etag = response.headers['ETag']
+
+    cached = client.get('/results/jobs.json', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+    # A different page of the same file has a different ETag
+    assert client.get('/results/jobs.json?limit=1', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_results_route_compresses_with_gzip(tmp_path, client):
+    write_results(tmp_path / 'jobs.json', JOBS)
+    response = client.get('/results/jobs.json', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data))['jobs'] == JOBS
+
+    plain = client.get('/results/jobs.json')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_json()['jobs'] == JOBS
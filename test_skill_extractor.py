@@ -0,0 +1,40 @@
+from skill_extractor import SkillExtractor
+
+SKILLS = {
+    'Java': ['java'],
+    'JavaScript': ['javascript'],
+    'C': ['c'],
+    'C++': ['c++'],
+    'C#': ['c#'],
+    'SQL': ['sql'],
+    'MySQL': ['mysql'],
+    'Node.js': ['node.js'],
+    'Machine Learning': ['machine learning'],
+}
+
+
+def test_extract_matches_whole_words_only():
+    extractor = SkillExtractor(SKILLS)
+    assert extractor.extract('JavaScript and MySQL experience') == {'JavaScript', 'MySQL'}
+
+
+def test_extract_finds_overlapping_patterns_separately():
+    extractor = SkillExtractor(SKILLS)
+    assert extractor.extract('Java, JavaScript, SQL and MySQL') == {'Java', 'JavaScript', 'SQL', 'MySQL'}
+
+
+def test_extract_handles_symbols_and_punctuation():
+    extractor = SkillExtractor(SKILLS)
+    assert extractor.extract('C++ and C# (not plain C).') == {'C++', 'C#', 'C'}
+    assert extractor.extract('Strong C++ developer') == {'C++'}
+    assert extractor.extract('Node.js, machine learning.') == {'Node.js', 'Machine Learning'}
+
+
+def test_extract_is_case_insensitive():
+    extractor = SkillExtractor(SKILLS)
+    assert extractor.extract('PYTHON? no, JAVA') == {'Java'}
+
+
+def test_extract_empty_text():
+    assert SkillExtractor(SKILLS).extract('') == set()
+    assert SkillExtractor(SKILLS).extract(None) == set()